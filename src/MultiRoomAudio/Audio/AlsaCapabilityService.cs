@@ -25,6 +25,14 @@ public partial class AlsaCapabilityService
     /// </summary>
     private readonly string _asoundPath;
 
+    /// <summary>
+    /// Parsed /proc/asound capabilities per (card, sink channel count).
+    /// Hardware capabilities are fixed for the lifetime of a card, but ALSA
+    /// reuses card numbers across unplug/replug, so the cache is cleared via
+    /// <see cref="ClearCache"/> whenever the device list is refreshed.
+    /// </summary>
+    private readonly Dictionary<(int CardNumber, int SinkChannels), DeviceCapabilities?> _capabilityCache = new();
+
     public AlsaCapabilityService(ILogger<AlsaCapabilityService> logger)
     {
         _logger = logger;
@@ -76,8 +84,26 @@ public partial class AlsaCapabilityService
 
         // Determine card type and parse accordingly
         // Pass sinkChannels so we use actual channel count from PulseAudio sink
-        var capabilities = TryParseHdaCodec(cardPath, alsaCardNumber, sinkChannels)
+        DeviceCapabilities? capabilities;
+        bool cached;
+        var cacheKey = (alsaCardNumber, sinkChannels);
+        lock (_capabilityCache)
+        {
+            cached = _capabilityCache.TryGetValue(cacheKey, out capabilities);
+        }
+
+        if (!cached)
+        {
+            // Parse outside the lock so slow proc-file reads don't serialize
+            // lookups for other cards; the parse is deterministic, so a
+            // concurrent duplicate insert is harmless
+            capabilities = TryParseHdaCodec(cardPath, alsaCardNumber, sinkChannels)
                        ?? TryParseUsbStream(cardPath, alsaCardNumber, sinkChannels);
+            lock (_capabilityCache)
+            {
+                _capabilityCache[cacheKey] = capabilities;
+            }
+        }
 
         if (capabilities != null)
         {
@@ -90,6 +116,20 @@ public partial class AlsaCapabilityService
         return CreatePulseAudioFallback(sinkSampleRate, sinkBitDepth, sinkChannels);
     }
 
+    /// <summary>
+    /// Drops all cached capabilities. ALSA reuses card numbers when devices
+    /// are unplugged and replugged, so a refreshed device list must re-read
+    /// the proc files rather than trust entries parsed from a previous card.
+    /// </summary>
+    public void ClearCache()
+    {
+        lock (_capabilityCache)
+        {
+            _capabilityCache.Clear();
+        }
+        _logger.LogDebug("Cleared ALSA capability cache");
+    }
+
     /// <summary>
     /// Parses HDA codec file for supported rates and bit depths.
     /// </summary>
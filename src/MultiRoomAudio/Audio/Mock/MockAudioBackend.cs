@@ -19,6 +19,14 @@ public class MockAudioBackend : IBackend
     private readonly MockHardwareConfigService? _mockConfigService;
     private readonly Dictionary<string, int> _volumes = new();
 
+    // Capability arrays are identical for every device of the same class, so
+    // share frozen instances instead of allocating fresh arrays per device on
+    // every enumeration (GetOutputDevices is hit by UI polling)
+    private static readonly int[] BluetoothSampleRates = { 44100, 48000 };
+    private static readonly int[] UsbSampleRates = { 44100, 48000, 96000, 192000 };
+    private static readonly int[] BluetoothBitDepths = { 16 };
+    private static readonly int[] UsbBitDepths = { 16, 24, 32 };
+
     public MockAudioBackend(
         ILogger<MockAudioBackend> logger,
         CustomSinksService? customSinksService = null,
@@ -78,10 +86,13 @@ public class MockAudioBackend : IBackend
     /// </summary>
     private static string? ExtractDeviceIdentifier(string sinkName)
     {
-        // Remove sink prefix (alsa_output. or bluez_sink.)
-        var identifier = sinkName
-            .Replace("alsa_output.", "")
-            .Replace("bluez_sink.", "");
+        // Remove sink prefix (alsa_output. or bluez_sink.) - strip only a
+        // leading prefix rather than Replace scans over the full string
+        var identifier = sinkName;
+        if (identifier.StartsWith("alsa_output.", StringComparison.Ordinal))
+            identifier = identifier["alsa_output.".Length..];
+        else if (identifier.StartsWith("bluez_sink.", StringComparison.Ordinal))
+            identifier = identifier["bluez_sink.".Length..];
 
         // Remove the profile suffix (last dot-separated segment like .analog-stereo)
         var lastDot = identifier.LastIndexOf('.');
@@ -266,12 +277,8 @@ public class MockAudioBackend : IBackend
             // Bluetooth devices have different sample rate support
             // Detect Bluetooth from device ID (bluez_sink prefix) - matches real PulseAudio naming
             var isBluetooth = config.Id.StartsWith("bluez_", StringComparison.OrdinalIgnoreCase);
-            var sampleRates = isBluetooth
-                ? new[] { 44100, 48000 }
-                : new[] { 44100, 48000, 96000, 192000 };
-            var bitDepths = isBluetooth
-                ? new[] { 16 }
-                : new[] { 16, 24, 32 };
+            var sampleRates = isBluetooth ? BluetoothSampleRates : UsbSampleRates;
+            var bitDepths = isBluetooth ? BluetoothBitDepths : UsbBitDepths;
 
             return new AudioDevice(
                 Index: config.Index,
@@ -237,7 +237,9 @@ public static partial class PactlCommandRunner
     {
         Exception? lastException = null;
         string lastError = string.Empty;
-        var argsForLogging = string.Join(" ", arguments);
+
+        // Only pay for the join when debug logging will actually emit it
+        var argsForLogging = _logger?.IsEnabled(LogLevel.Debug) == true ? string.Join(" ", arguments) : string.Empty;
 
         for (int attempt = 1; attempt <= maxRetries; attempt++)
         {
@@ -342,7 +342,7 @@ public static partial class PulseAudioCardEnumerator
 
             foreach (var block in sinkBlocks)
             {
-                var nameMatch = Regex.Match(block, @"Name:\s*(.+)$", RegexOptions.Multiline);
+                var nameMatch = SinkNameRegex().Match(block);
                 if (!nameMatch.Success)
                     continue;
 
@@ -383,8 +383,8 @@ public static partial class PulseAudioCardEnumerator
 
             foreach (var block in sinkBlocks)
             {
-                var nameMatch = Regex.Match(block, @"Name:\s*(.+)$", RegexOptions.Multiline);
-                var muteMatch = Regex.Match(block, @"Mute:\s*(yes|no)", RegexOptions.Multiline | RegexOptions.IgnoreCase);
+                var nameMatch = SinkNameRegex().Match(block);
+                var muteMatch = SinkMuteRegex().Match(block);
                 if (!nameMatch.Success || !muteMatch.Success)
                     continue;
 
@@ -428,6 +428,13 @@ public static partial class PulseAudioCardEnumerator
     [GeneratedRegex(@"Active Profile:\s*(.+)$", RegexOptions.Multiline)]
     private static partial Regex ActiveProfileRegex();
 
+    // Regex patterns for parsing pactl sink blocks
+    [GeneratedRegex(@"Name:\s*(.+)$", RegexOptions.Multiline)]
+    private static partial Regex SinkNameRegex();
+
+    [GeneratedRegex(@"Mute:\s*(yes|no)", RegexOptions.Multiline | RegexOptions.IgnoreCase)]
+    private static partial Regex SinkMuteRegex();
+
     // Validation patterns
     [GeneratedRegex(@"^[a-zA-Z0-9_\-.:]+$")]
     private static partial Regex CardNameValidationRegex();
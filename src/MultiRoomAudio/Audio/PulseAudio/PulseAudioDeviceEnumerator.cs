@@ -11,6 +11,15 @@ public static partial class PulseAudioDeviceEnumerator
 {
     private static ILogger? _logger;
 
+    // Short-TTL cache for the sink list. The UI and readiness probes
+    // re-enumerate frequently, and each enumeration costs two pactl
+    // fork+execs; sink topology rarely changes between polls. Explicit
+    // changes go through RefreshDevices(), which invalidates the cache.
+    private static readonly object CacheLock = new();
+    private static readonly TimeSpan CacheTtl = TimeSpan.FromSeconds(5);
+    private static List<AudioDevice>? _cachedDevices;
+    private static DateTime _cachedAtUtc;
+
     /// <summary>
     /// Configures the logger for device enumeration diagnostics.
     /// </summary>
@@ -25,6 +34,14 @@ public static partial class PulseAudioDeviceEnumerator
     /// </summary>
     public static IEnumerable<AudioDevice> GetOutputDevices()
     {
+        lock (CacheLock)
+        {
+            if (_cachedDevices != null && DateTime.UtcNow - _cachedAtUtc < CacheTtl)
+            {
+                return _cachedDevices;
+            }
+        }
+
         var devices = new List<AudioDevice>();
 
         try
@@ -60,6 +77,14 @@ public static partial class PulseAudioDeviceEnumerator
             }
 
             _logger?.LogDebug("Found {Count} PulseAudio sinks", devices.Count);
+
+            // Only cache successful enumerations; failures fall through so
+            // the next caller retries pactl immediately.
+            lock (CacheLock)
+            {
+                _cachedDevices = devices;
+                _cachedAtUtc = DateTime.UtcNow;
+            }
         }
         catch (Exception ex)
         {
@@ -119,12 +144,16 @@ public static partial class PulseAudioDeviceEnumerator
     }
 
     /// <summary>
-    /// Refreshes device list. For PulseAudio, this is a no-op since pactl always queries live state.
+    /// Refreshes device list by invalidating the short-TTL cache so the next
+    /// enumeration queries PulseAudio's live state.
     /// </summary>
     public static void RefreshDevices()
     {
-        // No-op: pactl always queries current PulseAudio state
-        _logger?.LogDebug("PulseAudio device refresh requested (no-op, pactl queries live state)");
+        lock (CacheLock)
+        {
+            _cachedDevices = null;
+        }
+        _logger?.LogDebug("PulseAudio device cache invalidated, next enumeration queries live state");
     }
 
     private static string? GetDefaultSinkName()
@@ -155,6 +155,7 @@ public static class DevicesEndpoint
         group.MapPost("/refresh", (
             BackendFactory backendFactory,
             DeviceMatchingService matchingService,
+            AlsaCapabilityService alsaCapabilities,
             ILoggerFactory loggerFactory) =>
         {
             var logger = loggerFactory.CreateLogger("DevicesEndpoint");
@@ -164,6 +165,10 @@ public static class DevicesEndpoint
                 logger.LogInformation("Refreshing audio device list via {Backend} backend...",
                     backendFactory.BackendName);
                 backendFactory.RefreshDevices();
+
+                // A replugged USB DAC can come back under a reused ALSA card
+                // number, so stale parsed capabilities must go too
+                alsaCapabilities.ClearCache();
                 var devices = matchingService.GetEnrichedDevices().ToList();
 
                 logger.LogInformation("Audio device refresh complete. Found {DeviceCount} devices", devices.Count);
@@ -19,6 +19,10 @@ public static class DiagnosticsEndpoint
         @"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",
         RegexOptions.Compiled);
 
+    // lscpu output lines worth including in the report - fixed set, allocated once
+    private static readonly string[] LscpuInterestingKeys =
+        { "Architecture", "CPU(s)", "Model name", "Hypervisor", "Virtualization" };
+
     /// <summary>
     /// Registers diagnostics API endpoints with the application.
     /// </summary>
@@ -200,20 +204,28 @@ public static class DiagnosticsEndpoint
     // Split out host info for streaming
     private static async Task AppendHostInfoAsync(StringBuilder sb, CancellationToken ct = default)
     {
+        // The five host probes are independent commands, so start them all
+        // before awaiting any result; output order stays fixed because the
+        // results are appended in sequence below.
+        var unameTask = RunCommandAsync("uname", "-a", ct);
+        var lscpuTask = RunCommandAsync("lscpu", "", ct);
+        var meminfoTask = RunCommandAsync("sh", "-c \"grep -E '^(MemTotal|MemFree|MemAvailable):' /proc/meminfo\"", ct);
+        var virtTask = RunCommandAsync("systemd-detect-virt", "", ct);
+        var osReleaseTask = RunCommandAsync("sh", "-c \"grep -E '^(PRETTY_NAME|ID|VERSION_ID)=' /etc/os-release\"", ct);
+
         // Kernel info (shared with host)
         sb.AppendLine("--- uname -a ---");
-        var uname = await RunCommandAsync("uname", "-a", ct);
+        var uname = await unameTask;
         sb.AppendLine(uname);
         sb.AppendLine();
 
         // CPU info including virtualization detection
         sb.AppendLine("--- lscpu (summary) ---");
-        var lscpu = await RunCommandAsync("lscpu", "", ct);
+        var lscpu = await lscpuTask;
         if (!lscpu.StartsWith("("))
         {
-            var interestingKeys = new[] { "Architecture", "CPU(s)", "Model name", "Hypervisor", "Virtualization" };
             var lines = lscpu.Split('\n')
-                .Where(line => interestingKeys.Any(key => line.TrimStart().StartsWith(key, StringComparison.OrdinalIgnoreCase)))
+                .Where(line => LscpuInterestingKeys.Any(key => line.TrimStart().StartsWith(key, StringComparison.OrdinalIgnoreCase)))
                 .ToList();
             sb.AppendLine(lines.Count > 0 ? string.Join("\n", lines) : lscpu);
         }
@@ -225,19 +237,19 @@ public static class DiagnosticsEndpoint
 
         // Memory info
         sb.AppendLine("--- Memory ---");
-        var meminfo = await RunCommandAsync("sh", "-c \"grep -E '^(MemTotal|MemFree|MemAvailable):' /proc/meminfo\"", ct);
+        var meminfo = await meminfoTask;
         sb.AppendLine(meminfo);
         sb.AppendLine();
 
         // Virtualization detection
         sb.AppendLine("--- Virtualization ---");
-        var virt = await RunCommandAsync("systemd-detect-virt", "", ct);
+        var virt = await virtTask;
         sb.AppendLine($"systemd-detect-virt: {virt}");
         sb.AppendLine();
 
         // Container OS
         sb.AppendLine("--- Container OS ---");
-        var osRelease = await RunCommandAsync("sh", "-c \"grep -E '^(PRETTY_NAME|ID|VERSION_ID)=' /etc/os-release\"", ct);
+        var osRelease = await osReleaseTask;
         sb.AppendLine(osRelease);
         sb.AppendLine();
     }
@@ -398,21 +410,28 @@ public static class DiagnosticsEndpoint
         sb.AppendLine("=== HOST / ENVIRONMENT INFO ===");
         sb.AppendLine();
 
+        // Same fan-out as AppendHostInfoAsync: start the independent host
+        // probes before awaiting any result, append in fixed order.
+        var unameTask = RunCommandAsync("uname", "-a");
+        var lscpuTask = RunCommandAsync("lscpu", "");
+        var meminfoTask = RunCommandAsync("sh", "-c \"grep -E '^(MemTotal|MemFree|MemAvailable):' /proc/meminfo\"");
+        var virtTask = RunCommandAsync("systemd-detect-virt", "");
+        var osReleaseTask = RunCommandAsync("sh", "-c \"grep -E '^(PRETTY_NAME|ID|VERSION_ID)=' /etc/os-release\"");
+
         // Kernel info (shared with host)
         sb.AppendLine("--- uname -a ---");
-        var uname = await RunCommandAsync("uname", "-a");
+        var uname = await unameTask;
         sb.AppendLine(uname);
         sb.AppendLine();
 
         // CPU info including virtualization detection
         sb.AppendLine("--- lscpu (summary) ---");
-        var lscpu = await RunCommandAsync("lscpu", "");
+        var lscpu = await lscpuTask;
         // Filter to just the interesting lines
         if (!lscpu.StartsWith("("))
         {
-            var interestingKeys = new[] { "Architecture", "CPU(s)", "Model name", "Hypervisor", "Virtualization" };
             var lines = lscpu.Split('\n')
-                .Where(line => interestingKeys.Any(key => line.TrimStart().StartsWith(key, StringComparison.OrdinalIgnoreCase)))
+                .Where(line => LscpuInterestingKeys.Any(key => line.TrimStart().StartsWith(key, StringComparison.OrdinalIgnoreCase)))
                 .ToList();
             sb.AppendLine(lines.Count > 0 ? string.Join("\n", lines) : lscpu);
         }
@@ -424,19 +443,19 @@ public static class DiagnosticsEndpoint
 
         // Memory info
         sb.AppendLine("--- Memory ---");
-        var meminfo = await RunCommandAsync("sh", "-c \"grep -E '^(MemTotal|MemFree|MemAvailable):' /proc/meminfo\"");
+        var meminfo = await meminfoTask;
         sb.AppendLine(meminfo);
         sb.AppendLine();
 
         // Virtualization detection
         sb.AppendLine("--- Virtualization ---");
-        var virt = await RunCommandAsync("systemd-detect-virt", "");
+        var virt = await virtTask;
         sb.AppendLine($"systemd-detect-virt: {virt}");
         sb.AppendLine();
 
         // Container OS
         sb.AppendLine("--- Container OS ---");
-        var osRelease = await RunCommandAsync("sh", "-c \"grep -E '^(PRETTY_NAME|ID|VERSION_ID)=' /etc/os-release\"");
+        var osRelease = await osReleaseTask;
         sb.AppendLine(osRelease);
         sb.AppendLine();
 
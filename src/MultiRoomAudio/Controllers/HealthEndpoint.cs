@@ -131,7 +131,14 @@ public static class HealthEndpoint
         .WithOpenApi();
     }
 
-    private static string GetVersion()
+    // Resolved once - APP_VERSION is baked in at container build time and the
+    // assembly version cannot change while the process is running, so there is
+    // no reason to re-read either on every periodic healthcheck.
+    private static readonly string CachedVersion = ResolveVersion();
+
+    private static string GetVersion() => CachedVersion;
+
+    private static string ResolveVersion()
     {
         // First check environment variable set by Docker build args
         var envVersion = Environment.GetEnvironmentVariable("APP_VERSION");
@@ -22,6 +22,7 @@ public sealed class FtdiRelayBoard : IRelayBoard
 {
     private IntPtr _context = IntPtr.Zero;
     private ushort _currentState;  // 16-bit state for up to 16 relays
+    private readonly byte[] _writeBuffer = new byte[2];  // Reused for every WriteState (guarded by _lock)
     private bool _disposed;
     private readonly ILogger<FtdiRelayBoard>? _logger;
     private readonly object _lock = new();
@@ -768,10 +769,16 @@ public sealed class FtdiRelayBoard : IRelayBoard
     }
 
     /// <summary>
-    /// Set all relay states at once.
+    /// Set all relay states at once with a single hardware write.
     /// </summary>
-    /// <param name="states">Value where each bit represents a relay (bit 0 = relay 1, supports up to 16 bits).</param>
-    public bool SetAllRelays(ushort states)
+    /// <param name="states">Value where each bit represents a relay channel (bit 0 = relay 1, supports up to 16 bits).</param>
+    /// <remarks>
+    /// Channel bits are mapped to FT245RL pin positions first (the Denkovi
+    /// 4-channel board wires relays to odd pins, so channel order differs from
+    /// pin order), then the full bitmask is written in one bitbang transfer.
+    /// This replaces up to 16 USB write+verify round trips with one.
+    /// </remarks>
+    public bool SetAllRelays(int states)
     {
         lock (_lock)
         {
@@ -781,13 +788,20 @@ public sealed class FtdiRelayBoard : IRelayBoard
                 return false;
             }
 
-            if (states == _currentState)
+            ushort pinState = 0;
+            for (int channel = 1; channel <= _channelCount; channel++)
+            {
+                if ((states & (1 << (channel - 1))) != 0)
+                    pinState |= GetBitMaskForChannel(channel);
+            }
+
+            if (pinState == _currentState)
                 return true;
 
-            if (WriteState(states))
+            if (WriteState(pinState))
             {
-                _currentState = states;
-                _logger?.LogDebug("All relays set to 0x{State:X2}", states);
+                _currentState = pinState;
+                _logger?.LogDebug("All relays set to 0x{State:X2}", pinState);
                 return true;
             }
 
@@ -854,12 +868,15 @@ public sealed class FtdiRelayBoard : IRelayBoard
             // The FT245RL in bitbang mode treats each byte as immediate output
             // For 16-relay boards, typically two FT245 chips are used, or the board
             // expects sequential bytes for the two 8-bit ports
-            var buffer = new byte[] { (byte)(state & 0xFF), (byte)((state >> 8) & 0xFF) };
+            // Reuse the preallocated buffer (all callers hold _lock) instead of
+            // allocating a fresh array for every relay toggle
+            _writeBuffer[0] = (byte)(state & 0xFF);
+            _writeBuffer[1] = (byte)((state >> 8) & 0xFF);
 
             // For 8-channel boards, only write 1 byte; for 16-channel, write 2
             // Since we can't detect this, we write based on whether high byte is used
             int bytesToWrite = (state > 0xFF) ? 2 : 1;
-            int bytesWritten = LibFtdi.ftdi_write_data(_context, buffer, bytesToWrite);
+            int bytesWritten = LibFtdi.ftdi_write_data(_context, _writeBuffer, bytesToWrite);
 
             if (bytesWritten < 0)
             {
@@ -48,6 +48,26 @@ public interface IRelayBoard : IDisposable
     /// </summary>
     RelayState GetRelay(int channel);
 
+    /// <summary>
+    /// Set all relay states at once from a bitmask (bit 0 = relay 1, supports up to 16 relays).
+    /// </summary>
+    /// <returns>True if all channels were set successfully.</returns>
+    /// <remarks>
+    /// Boards whose protocol supports a single multi-channel write override this
+    /// to avoid one USB/serial round trip per channel. The default implementation
+    /// falls back to per-channel <see cref="SetRelay"/> calls.
+    /// </remarks>
+    bool SetAllRelays(int states)
+    {
+        bool success = true;
+        for (int channel = 1; channel <= ChannelCount; channel++)
+        {
+            if (!SetRelay(channel, (states & (1 << (channel - 1))) != 0))
+                success = false;
+        }
+        return success;
+    }
+
     /// <summary>
     /// Turn all relays off.
     /// </summary>
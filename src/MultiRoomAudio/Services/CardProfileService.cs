@@ -320,6 +320,10 @@ public class CardProfileService
         // Give PulseAudio a moment to create the new sinks
         await Task.Delay(500);
 
+        // Profile changes replace the card's sinks - drop any cached device
+        // list so follow-up enumerations see the new topology immediately
+        _backend.RefreshDevices();
+
         await ApplyBootMutePreferenceAsync(card, defaultUnmute: true);
 
         return new CardProfileResponse(
@@ -917,17 +917,26 @@ public class ConfigurationService
         return $"card_{SanitizeKey(card.Name)}";
     }
 
+    private static readonly char[] InvalidKeyChars = Path.GetInvalidFileNameChars();
+
     /// <summary>
     /// Sanitize a string for use as a YAML key.
     /// </summary>
     private static string SanitizeKey(string input)
     {
-        // Replace problematic characters with underscores
-        return string.Join("_", input.Split(Path.GetInvalidFileNameChars()))
-            .Replace(":", "_")
-            .Replace(".", "_")
-            .Replace("-", "_")
-            .ToLowerInvariant();
+        // Replace problematic characters with underscores in a single pass
+        // instead of split+join plus three chained Replace calls, each of
+        // which allocated an intermediate string.
+        var chars = new char[input.Length];
+        for (var i = 0; i < input.Length; i++)
+        {
+            var c = input[i];
+            chars[i] = c is ':' or '.' or '-' || Array.IndexOf(InvalidKeyChars, c) >= 0
+                ? '_'
+                : char.ToLowerInvariant(c);
+        }
+
+        return new string(chars);
     }
 
     /// <summary>
@@ -13,8 +13,20 @@ namespace MultiRoomAudio.Services;
 /// Manages custom PulseAudio sinks (combine-sink and remap-sink).
 /// Implements IHostedService for startup sink creation and shutdown cleanup.
 /// </summary>
-public class CustomSinksService : IAsyncDisposable
+public partial class CustomSinksService : IAsyncDisposable
 {
+    /// <summary>
+    /// Extracts the USB vendor ID (first 4 hex chars) from a usb- device identifier.
+    /// </summary>
+    [System.Text.RegularExpressions.GeneratedRegex(@"^([0-9a-fA-F]{4})")]
+    private static partial System.Text.RegularExpressions.Regex UsbVendorIdPattern();
+
+    /// <summary>
+    /// Extracts the card number from an alsa_card_N sink identifier.
+    /// </summary>
+    [System.Text.RegularExpressions.GeneratedRegex(@"alsa_card_(\d+)", System.Text.RegularExpressions.RegexOptions.IgnoreCase)]
+    private static partial System.Text.RegularExpressions.Regex AlsaCardNumberPattern();
+
     private readonly ILogger<CustomSinksService> _logger;
     private readonly IPaModuleRunner _moduleRunner;
     private readonly EnvironmentService _environment;
@@ -207,6 +219,8 @@ public class CustomSinksService : IAsyncDisposable
                 SaveConfiguration(config);
                 success = true;
 
+                RefreshDeviceCache();
+
                 return ToResponse(request.Name, context);
             }
             else
@@ -316,6 +330,8 @@ public class CustomSinksService : IAsyncDisposable
                 SaveConfiguration(config);
                 success = true;
 
+                RefreshDeviceCache();
+
                 return ToResponse(request.Name, context);
             }
             else
@@ -457,6 +473,8 @@ public class CustomSinksService : IAsyncDisposable
             {
                 _logger.LogWarning(ex, "Failed to unload module for sink '{Name}'", name);
             }
+
+            RefreshDeviceCache();
         }
 
         // Remove from YAML
@@ -532,6 +550,11 @@ public class CustomSinksService : IAsyncDisposable
         {
             context.State = CustomSinkState.Error;
             context.ErrorMessage = ex.Message;
+
+            // The old module was already unloaded above, so the device
+            // topology changed even though the reload failed
+            RefreshDeviceCache();
+
             return ToResponse(name, context);
         }
     }
@@ -575,6 +598,8 @@ public class CustomSinksService : IAsyncDisposable
                 context.State = CustomSinkState.Loaded;
                 _logger.LogInformation("Loaded {Type}-sink '{Name}' with module index {Index}",
                     config.Type, config.Name, moduleIndex.Value);
+
+                RefreshDeviceCache();
             }
             else
             {
@@ -592,6 +617,16 @@ public class CustomSinksService : IAsyncDisposable
         }
     }
 
+    /// <summary>
+    /// Loading or unloading a sink module changes the device topology -
+    /// drop the backend's cached device list so follow-up enumerations
+    /// see the change immediately.
+    /// </summary>
+    private void RefreshDeviceCache()
+    {
+        _services.GetService<BackendFactory>()?.RefreshDevices();
+    }
+
     private List<CustomSinkConfiguration> LoadConfigurations()
     {
         // Read file content outside the lock to avoid blocking on slow I/O
@@ -1124,7 +1159,7 @@ public class CustomSinksService : IAsyncDisposable
         {
             // Extract VID from USB identifier (first 4 hex chars after "usb-")
             var usbInfo = deviceIdentifier.Substring(4);
-            var vidMatch = System.Text.RegularExpressions.Regex.Match(usbInfo, @"^([0-9a-fA-F]{4})");
+            var vidMatch = UsbVendorIdPattern().Match(usbInfo);
             if (vidMatch.Success)
             {
                 var vid = vidMatch.Groups[1].Value.ToLowerInvariant();
@@ -1194,8 +1229,7 @@ public class CustomSinksService : IAsyncDisposable
                 // Extract card number from old sink name (e.g., "alsa_card_0" -> "0")
                 // This helps distinguish between multiple cards that might have the same profile
                 string? oldCardNumber = null;
-                var cardMatch = System.Text.RegularExpressions.Regex.Match(
-                    deviceIdentifier, @"alsa_card_(\d+)", System.Text.RegularExpressions.RegexOptions.IgnoreCase);
+                var cardMatch = AlsaCardNumberPattern().Match(deviceIdentifier);
                 if (cardMatch.Success)
                 {
                     oldCardNumber = cardMatch.Groups[1].Value;
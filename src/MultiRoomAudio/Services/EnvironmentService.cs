@@ -194,25 +194,14 @@ public class EnvironmentService
 
         try
         {
-            if (!Directory.Exists(_configPath))
-            {
-                Directory.CreateDirectory(_configPath);
-                _logger.LogInformation("Created config directory: {ConfigPath}", _configPath);
-            }
-            else
-            {
-                _logger.LogDebug("Config directory exists: {ConfigPath}", _configPath);
-            }
-
-            if (!Directory.Exists(_logPath))
-            {
-                Directory.CreateDirectory(_logPath);
-                _logger.LogInformation("Created log directory: {LogPath}", _logPath);
-            }
-            else
-            {
-                _logger.LogDebug("Log directory exists: {LogPath}", _logPath);
-            }
+            // Directory.CreateDirectory is a no-op for existing directories,
+            // so a single call per path replaces the previous Exists+Create
+            // pair and its duplicate stat of the same path.
+            Directory.CreateDirectory(_configPath);
+            _logger.LogDebug("Config directory ready: {ConfigPath}", _configPath);
+
+            Directory.CreateDirectory(_logPath);
+            _logger.LogDebug("Log directory ready: {LogPath}", _logPath);
         }
         catch (Exception ex)
         {
@@ -59,6 +59,9 @@ public class LoggingService : IDisposable
     private const long MaxLogFileSizeBytes = 10 * 1024 * 1024; // 10MB
     private const int MaxLogFileCount = 5;
     private const string LogFileName = "multiroom-audio.log";
+    private static readonly TimeSpan FileFlushInterval = TimeSpan.FromSeconds(1);
+
+    private readonly Timer _flushTimer;
 
     /// <summary>
     /// Event fired when a new log entry is added.
@@ -71,6 +74,10 @@ public class LoggingService : IDisposable
         _buffer = new CircularBuffer<LogEntry>(InMemoryBufferSize);
 
         InitializeFileLogging();
+
+        // Writes are buffered (no AutoFlush) so chatty periods don't pay a
+        // flush syscall per line; this timer pushes stragglers to disk
+        _flushTimer = new Timer(_ => FlushFile(), null, FileFlushInterval, FileFlushInterval);
     }
 
     private void InitializeFileLogging()
@@ -78,16 +85,12 @@ public class LoggingService : IDisposable
         try
         {
             var logDir = _environment.LogPath;
-            if (!Directory.Exists(logDir))
-            {
-                Directory.CreateDirectory(logDir);
-            }
+
+            // CreateDirectory is a no-op when the directory already exists
+            Directory.CreateDirectory(logDir);
 
             _currentLogFilePath = Path.Combine(logDir, LogFileName);
-            _fileWriter = new StreamWriter(_currentLogFilePath, append: true, Encoding.UTF8)
-            {
-                AutoFlush = true
-            };
+            _fileWriter = new StreamWriter(_currentLogFilePath, append: true, Encoding.UTF8);
         }
         catch (Exception)
         {
@@ -307,6 +310,31 @@ public class LoggingService : IDisposable
                 // Format: 2026-01-10T14:23:45.123Z|INFO|Player|Message|Exception
                 var line = FormatLogLine(entry);
                 _fileWriter.WriteLine(line);
+
+                // Warnings and errors are what people tail the file for
+                // after a crash - don't leave them sitting in the buffer
+                if (entry.Level >= LogLevel.Warning)
+                {
+                    _fileWriter.Flush();
+                }
+            }
+            catch
+            {
+                // Ignore file write errors
+            }
+        }
+    }
+
+    /// <summary>
+    /// Flushes buffered log lines to disk. Called periodically by the flush timer.
+    /// </summary>
+    private void FlushFile()
+    {
+        lock (_fileLock)
+        {
+            try
+            {
+                _fileWriter?.Flush();
             }
             catch
             {
@@ -372,10 +400,7 @@ public class LoggingService : IDisposable
             File.Move(_currentLogFilePath, rotatedPath);
 
             // Create new current file
-            _fileWriter = new StreamWriter(_currentLogFilePath, append: false, Encoding.UTF8)
-            {
-                AutoFlush = true
-            };
+            _fileWriter = new StreamWriter(_currentLogFilePath, append: false, Encoding.UTF8);
         }
         catch
         {
@@ -438,8 +463,11 @@ public class LoggingService : IDisposable
             return;
         _disposed = true;
 
+        _flushTimer.Dispose();
+
         lock (_fileLock)
         {
+            // Dispose flushes any buffered lines
             _fileWriter?.Dispose();
             _fileWriter = null;
         }
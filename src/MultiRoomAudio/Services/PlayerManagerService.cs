@@ -1,5 +1,4 @@
 using System.Collections.Concurrent;
-using System.Text.RegularExpressions;
 using Microsoft.AspNetCore.SignalR;
 using MultiRoomAudio.Audio;
 using MultiRoomAudio.Audio.PulseAudio;
@@ -206,14 +205,6 @@ public class PlayerManagerService : IAsyncDisposable, IDisposable
     /// </summary>
     private const int MaxPlayerNameLength = 100;
 
-    /// <summary>
-    /// Pattern for valid player names.
-    /// Allows any printable characters except control characters (supports international characters).
-    /// </summary>
-    private static readonly Regex ValidPlayerNamePattern = new(
-        @"^[^\x00-\x1F\x7F]+$",
-        RegexOptions.Compiled);
-
     /// <summary>
     /// Initial delay before first reconnection attempt.
     /// </summary>
@@ -782,11 +773,15 @@ public class PlayerManagerService : IAsyncDisposable, IDisposable
             return false;
         }
 
-        // Validate against allowed character pattern (no control characters)
-        if (!ValidPlayerNamePattern.IsMatch(name))
+        // Reject C0 control characters and DEL in a single pass; any other
+        // printable character is allowed (supports international characters)
+        foreach (var c in name)
         {
-            errorMessage = "Player name cannot contain control characters.";
-            return false;
+            if (c < '\x20' || c == '\x7F')
+            {
+                errorMessage = "Player name cannot contain control characters.";
+                return false;
+            }
         }
 
         return true;
@@ -3685,22 +3680,28 @@ public class PlayerManagerService : IAsyncDisposable, IDisposable
         // Stop mDNS watch outside lock
         StopMdnsWatch();
 
-        // Dispose outside lock to avoid potential deadlocks
+        // Dispose outside lock to avoid potential deadlocks.
+        // Cancel everything first, then wait on all disposals against one
+        // shared deadline so N players don't serialize into N timeouts.
         foreach (var context in contextsToDispose)
         {
             // Unsubscribe event handlers first to prevent memory leaks and disposal crashes
             UnwireEvents(context);
             context.Cts.Cancel();
-            try
-            {
-                // Use Task.Run to avoid sync context deadlocks when calling async dispose methods
-                // Note: .Wait() is used here because Dispose() must be synchronous per IDisposable contract
-                Task.Run(() => DisposePlayerContextAsync(context)).Wait(DisposalTimeout);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Error disposing player context");
-            }
+        }
+
+        // Use Task.Run to avoid sync context deadlocks when calling async dispose methods
+        // Note: WaitAll is used here because Dispose() must be synchronous per IDisposable contract
+        var disposalTasks = contextsToDispose
+            .Select(context => Task.Run(() => DisposePlayerContextAsync(context)))
+            .ToArray();
+        try
+        {
+            Task.WaitAll(disposalTasks, DisposalTimeout);
+        }
+        catch (AggregateException ex)
+        {
+            _logger.LogWarning(ex, "Error disposing player contexts");
         }
 
         _reconnectionSignal.Dispose();
@@ -3742,12 +3743,18 @@ public class PlayerManagerService : IAsyncDisposable, IDisposable
         // Stop mDNS watch outside lock
         StopMdnsWatch();
 
-        // Dispose outside lock to avoid potential deadlocks
+        // Dispose outside lock to avoid potential deadlocks.
+        // Cancel everything first, then dispose all contexts concurrently so
+        // a slow disconnect on one player doesn't delay the rest.
         foreach (var context in contextsToDispose)
         {
             // Unsubscribe event handlers first to prevent memory leaks and disposal crashes
             UnwireEvents(context);
             context.Cts.Cancel();
+        }
+
+        await Task.WhenAll(contextsToDispose.Select(async context =>
+        {
             try
             {
                 await DisposePlayerContextAsync(context);
@@ -3756,7 +3763,7 @@ public class PlayerManagerService : IAsyncDisposable, IDisposable
             {
                 _logger.LogWarning(ex, "Error disposing player context");
             }
-        }
+        }));
 
         _reconnectionSignal.Dispose();
         _sinkEventLock.Dispose();
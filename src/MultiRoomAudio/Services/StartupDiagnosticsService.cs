@@ -46,10 +46,12 @@ public class StartupDiagnosticsService
         RunPactlDiagnostics();
     }
 
+    // Candidate PulseAudio socket directories - fixed set, so allocate once
+    private static readonly string[] PulseSocketPaths = { "/run/pulse", "/var/run/pulse", "/tmp/pulse" };
+
     private void CheckPulseAudioSockets()
     {
-        var pulseSocketPaths = new[] { "/run/pulse", "/var/run/pulse", "/tmp/pulse" };
-        foreach (var path in pulseSocketPaths)
+        foreach (var path in PulseSocketPaths)
         {
             if (Directory.Exists(path))
             {
@@ -74,11 +76,14 @@ public class StartupDiagnosticsService
     {
         try
         {
-            // Run pactl info for diagnostics
-            RunPactlInfo();
-
-            // Also list available sinks
-            RunPactlListSinks();
+            // The info and sink-list probes are independent, so start both pactl
+            // processes up front to overlap their round-trips, then collect the
+            // results in a fixed order to keep the log output readable.
+            using var infoProcess = StartPactl("info");
+            using var sinkProcess = StartPactl("list sinks short");
+
+            CollectPactlInfo(infoProcess);
+            CollectPactlListSinks(sinkProcess);
         }
         catch (Exception ex)
         {
@@ -86,19 +91,23 @@ public class StartupDiagnosticsService
         }
     }
 
-    private void RunPactlInfo()
+    private static Process? StartPactl(string arguments)
     {
         var psi = new ProcessStartInfo
         {
             FileName = "pactl",
-            Arguments = "info",
+            Arguments = arguments,
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             UseShellExecute = false,
             CreateNoWindow = true
         };
 
-        using var process = Process.Start(psi);
+        return Process.Start(psi);
+    }
+
+    private void CollectPactlInfo(Process? process)
+    {
         if (process == null)
         {
             _logger.LogWarning("Failed to start pactl process for diagnostics. Is PulseAudio available?");
@@ -127,19 +136,8 @@ public class StartupDiagnosticsService
         }
     }
 
-    private void RunPactlListSinks()
+    private void CollectPactlListSinks(Process? sinkProcess)
     {
-        var psi = new ProcessStartInfo
-        {
-            FileName = "pactl",
-            Arguments = "list sinks short",
-            RedirectStandardOutput = true,
-            RedirectStandardError = true,
-            UseShellExecute = false,
-            CreateNoWindow = true
-        };
-
-        using var sinkProcess = Process.Start(psi);
         if (sinkProcess == null)
         {
             _logger.LogWarning("Failed to start pactl process for sink diagnostics. Is PulseAudio available?");
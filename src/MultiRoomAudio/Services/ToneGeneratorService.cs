@@ -23,6 +23,19 @@ public class ToneGeneratorService
     // Track active playback to prevent overlapping tones
     private readonly SemaphoreSlim _playbackLock = new(1, 1);
 
+    // Cached paplay availability - binaries don't appear or disappear during
+    // the container's lifetime, so probe at most once per process
+    private bool? _paplayAvailable;
+
+    // Rendered tones are deterministic for a given (frequency, duration,
+    // channel) and the UI only uses a handful of presets, so cache the PCM
+    // bytes rather than re-synthesizing on every identify click. The key
+    // parameters come from the client, so the cache is capped: once full it
+    // is cleared before inserting, which keeps the steady-state presets
+    // cached while a parameter sweep can never pin unbounded memory
+    private const int MaxCachedTones = 8;
+    private readonly Dictionary<(int FrequencyHz, int DurationMs, bool Mono, string? Channel), byte[]> _toneCache = new();
+
     public ToneGeneratorService(ILogger<ToneGeneratorService> logger, EnvironmentService environment)
     {
         _logger = logger;
@@ -68,39 +81,15 @@ public class ToneGeneratorService
                 return;
             }
 
-            // Real hardware mode - generate and play via paplay
-            string? tempFile = null;
-            try
-            {
-                // Generate WAV file (with optional channel selection)
-                var wavData = GenerateWavFile(frequencyHz, durationMs, channelName);
-
-                // Write to temp file
-                tempFile = Path.Combine(Path.GetTempPath(), $"testtone_{Guid.NewGuid():N}.wav");
-                await File.WriteAllBytesAsync(tempFile, wavData, ct);
-                _logger.LogDebug("Generated test tone WAV file: {TempFile} ({Size} bytes)", tempFile, wavData.Length);
+            // Real hardware mode - render PCM (with optional channel
+            // selection) and pipe it straight to paplay's stdin. Raw PCM on
+            // a pipe skips the temp WAV write+read+unlink round trip.
+            var pcmData = GetOrRenderTone(frequencyHz, durationMs, channelName, mono: false);
+            _logger.LogDebug("Rendered test tone PCM ({Size} bytes)", pcmData.Length);
 
-                // Play via paplay
-                await PlayWithPaplayAsync(sinkName, tempFile, channelMap: null, ct);
+            await PlayWithPaplayAsync(sinkName, pcmData, Channels, channelMap: null, ct);
 
-                _logger.LogDebug("Test tone playback completed");
-            }
-            finally
-            {
-                // Clean up temp file
-                if (tempFile != null && File.Exists(tempFile))
-                {
-                    try
-                    {
-                        File.Delete(tempFile);
-                        _logger.LogDebug("Cleaned up temp file: {TempFile}", tempFile);
-                    }
-                    catch (Exception ex)
-                    {
-                        _logger.LogWarning(ex, "Failed to clean up temp file: {TempFile}", tempFile);
-                    }
-                }
-            }
+            _logger.LogDebug("Test tone playback completed");
         }
         finally
         {
@@ -149,39 +138,14 @@ public class ToneGeneratorService
                 return;
             }
 
-            // Real hardware mode - generate mono WAV and use --channel-map for routing
-            string? tempFile = null;
-            try
-            {
-                // Generate mono WAV file
-                var wavData = GenerateMonoWavFile(frequencyHz, durationMs);
-
-                // Write to temp file
-                tempFile = Path.Combine(Path.GetTempPath(), $"testtone_{Guid.NewGuid():N}.wav");
-                await File.WriteAllBytesAsync(tempFile, wavData, ct);
-                _logger.LogDebug("Generated mono test tone WAV: {TempFile} ({Size} bytes)", tempFile, wavData.Length);
+            // Real hardware mode - render mono PCM and pipe it to paplay with
+            // --channel-map so PulseAudio routes it to the requested channel
+            var pcmData = GetOrRenderTone(frequencyHz, durationMs, channelName: null, mono: true);
+            _logger.LogDebug("Rendered mono test tone PCM ({Size} bytes)", pcmData.Length);
 
-                // Play via paplay with --channel-map to route to specific channel
-                await PlayWithPaplayAsync(sinkName, tempFile, channelName, ct);
+            await PlayWithPaplayAsync(sinkName, pcmData, channels: 1, channelName, ct);
 
-                _logger.LogDebug("Test tone playback completed on channel {Channel}", channelName);
-            }
-            finally
-            {
-                // Clean up temp file
-                if (tempFile != null && File.Exists(tempFile))
-                {
-                    try
-                    {
-                        File.Delete(tempFile);
-                        _logger.LogDebug("Cleaned up temp file: {TempFile}", tempFile);
-                    }
-                    catch (Exception ex)
-                    {
-                        _logger.LogWarning(ex, "Failed to clean up temp file: {TempFile}", tempFile);
-                    }
-                }
-            }
+            _logger.LogDebug("Test tone playback completed on channel {Channel}", channelName);
         }
         finally
         {
@@ -190,41 +154,53 @@ public class ToneGeneratorService
     }
 
     /// <summary>
-    /// Generate a mono WAV file containing a sine wave tone.
+    /// Return a cached rendering of the requested tone, synthesizing it on
+    /// first use. The mono flag is a separate key component because "mono"
+    /// is also a valid channel name, and a 1-channel render must never share
+    /// a slot with a 2-channel render targeting the "mono" channel.
+    /// </summary>
+    private byte[] GetOrRenderTone(int frequencyHz, int durationMs, string? channelName, bool mono)
+    {
+        var key = (frequencyHz, durationMs, mono, mono ? null : channelName);
+
+        lock (_toneCache)
+        {
+            if (_toneCache.TryGetValue(key, out var cached))
+                return cached;
+        }
+
+        var pcmData = mono
+            ? GenerateMonoPcm(frequencyHz, durationMs)
+            : GenerateStereoPcm(frequencyHz, durationMs, channelName);
+
+        lock (_toneCache)
+        {
+            if (_toneCache.Count >= MaxCachedTones && !_toneCache.ContainsKey(key))
+                _toneCache.Clear();
+            _toneCache[key] = pcmData;
+        }
+
+        return pcmData;
+    }
+
+    /// <summary>
+    /// Generate raw mono s16le PCM containing a sine wave tone.
     /// Used with paplay's --channel-map flag to route to specific channels.
     /// </summary>
     /// <param name="frequencyHz">Frequency of the tone in Hz</param>
     /// <param name="durationMs">Duration of the tone in milliseconds</param>
-    private byte[] GenerateMonoWavFile(int frequencyHz, int durationMs)
+    private static byte[] GenerateMonoPcm(int frequencyHz, int durationMs)
     {
         const int monoChannels = 1;
         var numSamples = (int)(SampleRate * durationMs / 1000.0);
         var dataSize = numSamples * monoChannels * (BitsPerSample / 8);
 
-        using var ms = new MemoryStream();
-        using var writer = new BinaryWriter(ms);
-
-        // WAV header
-        writer.Write("RIFF"u8);
-        writer.Write(36 + dataSize);  // File size - 8
-        writer.Write("WAVE"u8);
-
-        // Format chunk
-        writer.Write("fmt "u8);
-        writer.Write(16);  // Chunk size
-        writer.Write((short)1);  // PCM format
-        writer.Write((short)monoChannels);
-        writer.Write(SampleRate);
-        writer.Write(SampleRate * monoChannels * BitsPerSample / 8);  // Byte rate
-        writer.Write((short)(monoChannels * BitsPerSample / 8));  // Block align
-        writer.Write((short)BitsPerSample);
-
-        // Data chunk
-        writer.Write("data"u8);
-        writer.Write(dataSize);
-
-        // Generate sine wave samples with fade in/out to avoid clicks
+        // Generate sine wave samples with fade in/out to avoid clicks.
+        // Fill one sample buffer and emit it with a single copy instead of
+        // one BinaryWriter.Write per sample (tens of thousands of tiny
+        // stream writes for a typical tone).
         var fadeLength = Math.Min(numSamples / 10, SampleRate / 20);  // 50ms fade or 10% of duration
+        var samples = new short[numSamples];
 
         for (int i = 0; i < numSamples; i++)
         {
@@ -246,22 +222,21 @@ public class ToneGeneratorService
             sample *= envelope;
 
             // Convert to 16-bit signed integer
-            short sampleInt = (short)(sample * short.MaxValue * 0.4);  // 40% volume
-
-            // Write mono sample
-            writer.Write(sampleInt);
+            samples[i] = (short)(sample * short.MaxValue * 0.4);  // 40% volume
         }
 
-        return ms.ToArray();
+        var sampleBytes = new byte[dataSize];
+        Buffer.BlockCopy(samples, 0, sampleBytes, 0, dataSize);
+        return sampleBytes;
     }
 
     /// <summary>
-    /// Generate a WAV file containing a sine wave tone.
+    /// Generate raw interleaved stereo s16le PCM containing a sine wave tone.
     /// </summary>
     /// <param name="frequencyHz">Frequency of the tone in Hz</param>
     /// <param name="durationMs">Duration of the tone in milliseconds</param>
     /// <param name="channelName">Optional channel name for single-channel playback (e.g., "front-left", "front-right")</param>
-    private byte[] GenerateWavFile(int frequencyHz, int durationMs, string? channelName = null)
+    private static byte[] GenerateStereoPcm(int frequencyHz, int durationMs, string? channelName = null)
     {
         var numSamples = (int)(SampleRate * durationMs / 1000.0);
         var dataSize = numSamples * Channels * (BitsPerSample / 8);
@@ -277,30 +252,11 @@ public class ToneGeneratorService
             playRight = IsRightChannel(channelName);
         }
 
-        using var ms = new MemoryStream();
-        using var writer = new BinaryWriter(ms);
-
-        // WAV header
-        writer.Write("RIFF"u8);
-        writer.Write(36 + dataSize);  // File size - 8
-        writer.Write("WAVE"u8);
-
-        // Format chunk
-        writer.Write("fmt "u8);
-        writer.Write(16);  // Chunk size
-        writer.Write((short)1);  // PCM format
-        writer.Write((short)Channels);
-        writer.Write(SampleRate);
-        writer.Write(SampleRate * Channels * BitsPerSample / 8);  // Byte rate
-        writer.Write((short)(Channels * BitsPerSample / 8));  // Block align
-        writer.Write((short)BitsPerSample);
-
-        // Data chunk
-        writer.Write("data"u8);
-        writer.Write(dataSize);
-
-        // Generate sine wave samples with fade in/out to avoid clicks
+        // Generate sine wave samples with fade in/out to avoid clicks.
+        // Same single-buffer approach as GenerateMonoPcm: two interleaved
+        // channel samples per frame, one copy for the whole buffer.
         var fadeLength = Math.Min(numSamples / 10, SampleRate / 20);  // 50ms fade or 10% of duration
+        var samples = new short[numSamples * Channels];
 
         for (int i = 0; i < numSamples; i++)
         {
@@ -324,14 +280,14 @@ public class ToneGeneratorService
             // Convert to 16-bit signed integer
             short sampleInt = (short)(sample * short.MaxValue * 0.4);  // 40% volume to avoid clipping and reduce loudness
 
-            // Write sample for left channel
-            writer.Write(playLeft ? sampleInt : (short)0);
-
-            // Write sample for right channel
-            writer.Write(playRight ? sampleInt : (short)0);
+            // Interleave left and right channel samples
+            samples[i * 2] = playLeft ? sampleInt : (short)0;
+            samples[i * 2 + 1] = playRight ? sampleInt : (short)0;
         }
 
-        return ms.ToArray();
+        var sampleBytes = new byte[dataSize];
+        Buffer.BlockCopy(samples, 0, sampleBytes, 0, dataSize);
+        return sampleBytes;
     }
 
     /// <summary>
@@ -361,17 +317,19 @@ public class ToneGeneratorService
     };
 
     /// <summary>
-    /// Play a WAV file through paplay to a specific sink.
+    /// Play raw s16le PCM through paplay to a specific sink, piped via stdin.
     /// </summary>
     /// <param name="sinkName">PulseAudio sink name</param>
-    /// <param name="wavFile">Path to WAV file</param>
+    /// <param name="pcmData">Raw interleaved s16le PCM sample data</param>
+    /// <param name="channels">Number of interleaved channels in the PCM data</param>
     /// <param name="channelMap">Optional channel map for routing (e.g., "side-left")</param>
     /// <param name="ct">Cancellation token</param>
-    private async Task PlayWithPaplayAsync(string sinkName, string wavFile, string? channelMap, CancellationToken ct)
+    private async Task PlayWithPaplayAsync(string sinkName, byte[] pcmData, int channels, string? channelMap, CancellationToken ct)
     {
         var psi = new ProcessStartInfo
         {
             FileName = "paplay",
+            RedirectStandardInput = true,
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             UseShellExecute = false,
@@ -379,22 +337,41 @@ public class ToneGeneratorService
         };
 
         psi.ArgumentList.Add($"--device={sinkName}");
+        psi.ArgumentList.Add("--raw");
+        psi.ArgumentList.Add($"--rate={SampleRate}");
+        psi.ArgumentList.Add($"--channels={channels}");
+        psi.ArgumentList.Add("--format=s16le");
         if (!string.IsNullOrEmpty(channelMap))
         {
             psi.ArgumentList.Add("--no-remix");
             psi.ArgumentList.Add($"--channel-map={channelMap}");
         }
-        psi.ArgumentList.Add(wavFile);
 
-        _logger.LogDebug("Running: paplay --device={Sink}{NoRemix}{ChannelMap} {File}",
+        _logger.LogDebug("Running: paplay --device={Sink} --raw --rate={Rate} --channels={Channels} --format=s16le{NoRemix}{ChannelMap}",
             sinkName,
+            SampleRate,
+            channels,
             !string.IsNullOrEmpty(channelMap) ? " --no-remix" : "",
-            !string.IsNullOrEmpty(channelMap) ? $" --channel-map={channelMap}" : "",
-            wavFile);
+            !string.IsNullOrEmpty(channelMap) ? $" --channel-map={channelMap}" : "");
 
         using var process = new Process { StartInfo = psi };
         process.Start();
 
+        // Feed the rendered samples through the pipe; paplay exits once
+        // stdin closes and the buffered audio has drained. If paplay dies
+        // immediately (bad sink, bad args) the write hits a broken pipe -
+        // swallow that so the exit-code/stderr check below can report the
+        // actual paplay error instead of a bare IOException
+        try
+        {
+            await process.StandardInput.BaseStream.WriteAsync(pcmData, ct);
+            process.StandardInput.Close();
+        }
+        catch (IOException ex)
+        {
+            _logger.LogDebug(ex, "paplay closed stdin before all samples were written");
+        }
+
         // Wait for completion with timeout
         var timeoutMs = 10000;  // 10 second timeout
         using var timeoutCts = new CancellationTokenSource(timeoutMs);
@@ -421,30 +398,28 @@ public class ToneGeneratorService
 
     /// <summary>
     /// Check if paplay is available on the system.
+    /// Scans PATH in-process instead of spawning 'which' - the check only
+    /// needs to know the binary exists, not execute anything.
     /// </summary>
-    public async Task<bool> IsPaplayAvailableAsync()
+    public Task<bool> IsPaplayAvailableAsync()
     {
+        if (_paplayAvailable.HasValue)
+            return Task.FromResult(_paplayAvailable.Value);
+
         try
         {
-            var psi = new ProcessStartInfo
-            {
-                FileName = "which",
-                Arguments = "paplay",
-                RedirectStandardOutput = true,
-                UseShellExecute = false,
-                CreateNoWindow = true
-            };
-
-            using var process = Process.Start(psi);
-            if (process == null)
-                return false;
-
-            await process.WaitForExitAsync();
-            return process.ExitCode == 0;
+            var pathVar = Environment.GetEnvironmentVariable("PATH") ?? string.Empty;
+            var available = pathVar
+                .Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries)
+                .Any(dir => File.Exists(Path.Combine(dir, "paplay")));
+
+            _paplayAvailable = available;
+            return Task.FromResult(available);
         }
         catch
         {
-            return false;
+            _paplayAvailable = false;
+            return Task.FromResult(false);
         }
     }
 }
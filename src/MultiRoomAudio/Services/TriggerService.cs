@@ -914,11 +914,8 @@ public class TriggerService : IAsyncDisposable
     /// </summary>
     private void RestorePreviousState(IRelayBoard board, TriggerBoardConfiguration config, int previousState)
     {
-        for (int i = 1; i <= config.ChannelCount; i++)
-        {
-            bool wasOn = (previousState & (1 << (i - 1))) != 0;
-            board.SetRelay(i, wasOn);
-        }
+        // Single bulk write where the board supports it (FTDI), per-channel fallback otherwise
+        board.SetAllRelays(previousState);
         _logger.LogInformation("Board '{BoardId}': Restored previous relay state 0x{State:X2} (manual reconnect)", config.BoardId, previousState);
     }
 
@@ -939,10 +936,7 @@ public class TriggerService : IAsyncDisposable
                 break;
 
             case RelayStartupBehavior.AllOn:
-                for (int i = 1; i <= config.ChannelCount; i++)
-                {
-                    board.SetRelay(i, true);
-                }
+                board.SetAllRelays((1 << config.ChannelCount) - 1);
                 _logger.LogInformation("Startup behavior: Board '{BoardId}' all {Count} relays → ON",
                     config.BoardId, config.ChannelCount);
                 break;
@@ -974,10 +968,7 @@ public class TriggerService : IAsyncDisposable
                 break;
 
             case RelayStartupBehavior.AllOn:
-                for (int i = 1; i <= config.ChannelCount; i++)
-                {
-                    board.SetRelay(i, true);
-                }
+                board.SetAllRelays((1 << config.ChannelCount) - 1);
                 _logger.LogInformation("Shutdown behavior: Board '{BoardId}' all {Count} relays → ON",
                     config.BoardId, config.ChannelCount);
                 break;
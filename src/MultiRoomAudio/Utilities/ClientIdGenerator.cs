@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.RegularExpressions;
@@ -15,12 +16,35 @@ namespace MultiRoomAudio.Utilities;
 /// 3. Cryptographic strength is not relevant here - we're generating deterministic IDs
 ///    from public data (hostname + device name), not protecting secrets
 /// </remarks>
-public static class ClientIdGenerator
+public static partial class ClientIdGenerator
 {
     private const string Prefix = "sendspin";
+
+    /// <summary>
+    /// Pattern for whitespace and underscore runs (replaced with a dash).
+    /// </summary>
+    [GeneratedRegex(@"[\s_]+", RegexOptions.Compiled)]
+    private static partial Regex SeparatorRunPattern();
+
+    /// <summary>
+    /// Pattern for characters not allowed in sanitized names.
+    /// </summary>
+    [GeneratedRegex(@"[^a-z0-9\-]", RegexOptions.Compiled)]
+    private static partial Regex DisallowedCharPattern();
+
+    /// <summary>
+    /// Pattern for consecutive dashes (collapsed to one).
+    /// </summary>
+    [GeneratedRegex(@"-+", RegexOptions.Compiled)]
+    private static partial Regex DashRunPattern();
     private const int NameMaxLength = 20;
     private const int HashSuffixLength = 8;
 
+    // IDs are pure functions of the player name and get re-derived on every
+    // restart and config reload, so memoize per name
+    private static readonly ConcurrentDictionary<string, string> IdCache = new();
+    private static readonly ConcurrentDictionary<string, string> MacCache = new();
+
     /// <summary>
     /// Generate a unique client ID from player name.
     /// Creates a deterministic ID based on the player name, prefixed with 'sendspin-'.
@@ -32,13 +56,16 @@ public static class ClientIdGenerator
         if (string.IsNullOrWhiteSpace(playerName))
             throw new ArgumentException("Player name cannot be empty", nameof(playerName));
 
-        // Create a short hash suffix for uniqueness
-        var hashSuffix = ComputeMd5Prefix(playerName, HashSuffixLength);
+        return IdCache.GetOrAdd(playerName, static name =>
+        {
+            // Create a short hash suffix for uniqueness
+            var hashSuffix = ComputeMd5Prefix(name, HashSuffixLength);
 
-        // Sanitize name for use in ID (lowercase, replace spaces with dashes)
-        var safeName = SanitizeName(playerName);
+            // Sanitize name for use in ID (lowercase, replace spaces with dashes)
+            var safeName = SanitizeName(name);
 
-        return $"{Prefix}-{safeName}-{hashSuffix}";
+            return $"{Prefix}-{safeName}-{hashSuffix}";
+        });
     }
 
     /// <summary>
@@ -52,6 +79,11 @@ public static class ClientIdGenerator
         if (string.IsNullOrWhiteSpace(playerName))
             throw new ArgumentException("Player name cannot be empty", nameof(playerName));
 
+        return MacCache.GetOrAdd(playerName, static name => ComputeMac(name));
+    }
+
+    private static string ComputeMac(string playerName)
+    {
         // Generate MD5 hash of the player name
         var hashBytes = MD5.HashData(Encoding.UTF8.GetBytes(playerName));
 
@@ -63,8 +95,9 @@ public static class ClientIdGenerator
         // Clear multicast bit (bit 0 of first octet)
         macBytes[0] = (byte)((macBytes[0] | 0x02) & 0xFE);
 
-        // Format as MAC address
-        return string.Join(":", macBytes.Select(b => b.ToString("X2")));
+        // Format as MAC address in one interpolation instead of a LINQ
+        // projection that allocates a string per octet plus the join
+        return $"{macBytes[0]:X2}:{macBytes[1]:X2}:{macBytes[2]:X2}:{macBytes[3]:X2}:{macBytes[4]:X2}:{macBytes[5]:X2}";
     }
 
     /// <summary>
@@ -86,13 +119,13 @@ public static class ClientIdGenerator
         var sanitized = name.ToLowerInvariant();
 
         // Replace spaces and underscores with dashes
-        sanitized = Regex.Replace(sanitized, @"[\s_]+", "-");
+        sanitized = SeparatorRunPattern().Replace(sanitized, "-");
 
         // Remove any non-alphanumeric characters except dashes
-        sanitized = Regex.Replace(sanitized, @"[^a-z0-9\-]", "");
+        sanitized = DisallowedCharPattern().Replace(sanitized, "");
 
         // Remove consecutive dashes
-        sanitized = Regex.Replace(sanitized, @"-+", "-");
+        sanitized = DashRunPattern().Replace(sanitized, "-");
 
         // Trim dashes from start/end
         sanitized = sanitized.Trim('-');
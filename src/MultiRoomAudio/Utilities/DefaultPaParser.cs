@@ -27,6 +27,12 @@ public partial class DefaultPaParser
     [GeneratedRegex(@"(\w+)=(?:""([^""]*)""|([^\s]+))", RegexOptions.Compiled)]
     private static partial Regex KeyValuePattern();
 
+    /// <summary>
+    /// Regex pattern to extract device.description from sink_properties values.
+    /// </summary>
+    [GeneratedRegex(@"device\.description=""?([^""]+)""?", RegexOptions.Compiled)]
+    private static partial Regex DeviceDescriptionPattern();
+
     /// <summary>
     /// Marker comment added when we comment out a line.
     /// </summary>
@@ -140,7 +146,7 @@ public partial class DefaultPaParser
         string? description = null;
         if (keyValues.TryGetValue("sink_properties", out var properties))
         {
-            var descMatch = Regex.Match(properties, @"device\.description=""?([^""]+)""?");
+            var descMatch = DeviceDescriptionPattern().Match(properties);
             if (descMatch.Success)
             {
                 description = descMatch.Groups[1].Value;
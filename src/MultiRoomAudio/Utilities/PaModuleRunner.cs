@@ -435,8 +435,17 @@ public partial class PaModuleRunner : IPaModuleRunner
         var lines = result.Output.Split('\n', StringSplitOptions.RemoveEmptyEntries);
         foreach (var line in lines)
         {
-            var parts = line.Split('\t');
-            if (parts.Length >= 2 && parts[1].Equals(sinkName, StringComparison.OrdinalIgnoreCase))
+            // Format: index\tname\t... - only the name field matters here, so
+            // slice it out instead of splitting the whole line into an array.
+            var firstTab = line.IndexOf('\t');
+            if (firstTab < 0)
+                continue;
+
+            var rest = line.AsSpan(firstTab + 1);
+            var secondTab = rest.IndexOf('\t');
+            var name = secondTab >= 0 ? rest[..secondTab] : rest;
+
+            if (name.Equals(sinkName, StringComparison.OrdinalIgnoreCase))
             {
                 return true;
             }
@@ -465,7 +474,9 @@ public partial class PaModuleRunner : IPaModuleRunner
         }
 
         using var process = new Process { StartInfo = psi };
-        var argsForLogging = string.Join(" ", arguments);
+
+        // Only pay for the join when debug logging will actually emit it
+        var argsForLogging = _logger.IsEnabled(LogLevel.Debug) ? string.Join(" ", arguments) : string.Empty;
 
         try
         {
@@ -1,3 +1,4 @@
+using System.Runtime.CompilerServices;
 using Microsoft.Extensions.Logging;
 
 namespace MultiRoomAudio.Utilities;
@@ -12,6 +13,11 @@ public sealed class PrefixedLogger<T> : ILogger<T>
     private readonly ILogger<T> _inner;
     private readonly string _prefix;
 
+    // Formatter delegates are cached statics (LoggerMessage machinery reuses
+    // one instance per message template), so wrapping them once per delegate
+    // avoids allocating a fresh prefixing closure on every log call
+    private readonly ConditionalWeakTable<Delegate, Delegate> _wrappedFormatters = new();
+
     /// <summary>
     /// Creates a new prefixed logger.
     /// </summary>
@@ -40,13 +46,17 @@ public sealed class PrefixedLogger<T> : ILogger<T>
         if (!IsEnabled(logLevel))
             return;
 
-        // Wrap the formatter to add the prefix
-        _inner.Log(
-            logLevel,
-            eventId,
-            state,
-            exception,
-            (s, ex) => _prefix + formatter(s, ex));
+        // Wrap the formatter to add the prefix, reusing the wrapper across
+        // calls that pass the same formatter delegate
+        var wrapped = (Func<TState, Exception?, string>)_wrappedFormatters.GetValue(
+            formatter,
+            f =>
+            {
+                var original = (Func<TState, Exception?, string>)f;
+                return new Func<TState, Exception?, string>((s, ex) => _prefix + original(s, ex));
+            });
+
+        _inner.Log(logLevel, eventId, state, exception, wrapped);
     }
 }
 
@@ -17,6 +17,12 @@ public partial class VolumeCommandRunner
     [GeneratedRegex(@"^[a-zA-Z0-9_\-\.]+$", RegexOptions.Compiled)]
     private static partial Regex ValidSinkPattern();
 
+    /// <summary>
+    /// Pattern for extracting the volume percentage from pactl get-sink-volume output.
+    /// </summary>
+    [GeneratedRegex(@"(\d+)%", RegexOptions.Compiled)]
+    private static partial Regex VolumePercentPattern();
+
     /// <summary>
     /// Characters that are dangerous in shell commands and must be rejected.
     /// </summary>
@@ -90,7 +96,7 @@ public partial class VolumeCommandRunner
                 return null;
 
             // Parse output like "front-left: 65536 / 100%"
-            var match = Regex.Match(result.Output, @"(\d+)%");
+            var match = VolumePercentPattern().Match(result.Output);
             if (match.Success)
             {
                 var volumePercent = int.Parse(match.Groups[1].Value);
@@ -186,7 +192,8 @@ public partial class VolumeCommandRunner
         }
 
         using var process = new Process { StartInfo = psi };
-        var argsForLogging = string.Join(" ", arguments);
+        // Only pay for the join when debug logging will actually emit it
+        var argsForLogging = _logger.IsEnabled(LogLevel.Debug) ? string.Join(" ", arguments) : string.Empty;
 
         try
         {